@@ -1,10 +1,12 @@
 from flask import Flask
 from flask_cors import CORS
 from .config import load_config
+from .json_provider import ORJSONProvider
 
 
 def create_app():
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     # Load configuration
@@ -19,7 +19,7 @@ ToolPayload = Dict[str, Any]
 ToolResult = Dict[str, Any]
 ToolHandler = Callable[[ToolPayload], ToolResult]
 
-TOOL_HANDLERS: dict[str, ToolHandler] = ALL_TOOL_HANDLERS
+TOOL_HANDLERS: Mapping[str, ToolHandler] = ALL_TOOL_HANDLERS
 
 print(f"Available tools: {list(TOOL_HANDLERS.keys())}")
 
@@ -129,7 +129,13 @@ def run_academic_advisor_agent(
                 }
                 tool_events.append(tool_event)
                 if function_name == "get_professor_summary":
-                    prof_name = str(call_args.get("professor_name", "")).strip()
+                    prof_names = [call_args.get("professor_name", "")]
+                elif function_name == "get_professor_summaries":
+                    prof_names = call_args.get("professor_names") or []
+                else:
+                    prof_names = []
+                for prof_name in prof_names:
+                    prof_name = str(prof_name).strip()
                     if prof_name.lower() == "qing hui":
                         tool_events.append({
                             "type": "rmp_professor",
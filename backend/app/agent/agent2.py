@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Any, Literal, Sequence, TypedDict
+from typing import Any, Iterator, Literal, Sequence, TypedDict
 
 from agents import Agent, WebSearchTool, Runner, ItemHelpers, Session, RunResult
 
@@ -20,6 +20,9 @@ ROLE_ALIASES: dict[str, str] = {
     "advisor": "assistant",
 }
 
+_VALID_ROLES: frozenset[str] = frozenset({"user", "assistant", "system"})
+_TOOL_ITEM_TYPES: frozenset[str] = frozenset({"tool_call_item", "tool_call_output_item"})
+
 
 class ChatMessage(TypedDict):
     role: Literal["student", "advisor", "user", "assistant", "system"]
@@ -42,7 +45,7 @@ def _to_response_items(chat_history: Sequence[ChatMessage]) -> list[dict[str, st
         role = message["role"].lower()
         mapped_role = ROLE_ALIASES.get(role, role)
 
-        if mapped_role not in {"user", "assistant", "system"}:
+        if mapped_role not in _VALID_ROLES:
             raise ValueError(
                 f"Unsupported role '{message['role']}' at position {index}. "
                 "Expected one of student, advisor, user, assistant, or system."
@@ -73,22 +76,16 @@ def _extract_final_reply(run_result: RunResult) -> str:
     return str(final_output)
 
 
-def _extract_tool_events(new_items: Sequence[Any]) -> list[dict[str, Any]]:
-    """Summarize tool call activity from newly generated items."""
-    events: list[dict[str, Any]] = []
-
+def _iter_tool_events(new_items: Sequence[Any]) -> Iterator[dict[str, Any]]:
+    """Yield summaries of tool call activity from newly generated items."""
     for item in new_items:
         item_type = getattr(item, "type", None)
-        if item_type in {"tool_call_item", "tool_call_output_item"}:
-            events.append(
-                {
-                    "agent": getattr(item.agent, "name", "unknown"),
-                    "type": item_type,
-                    "payload": item.to_input_item(),
-                }
-            )
-
-    return events
+        if item_type in _TOOL_ITEM_TYPES:
+            yield {
+                "agent": getattr(item.agent, "name", "unknown"),
+                "type": item_type,
+                "payload": item.to_input_item(),
+            }
 
 
 def get_advisor_completion(
@@ -135,7 +132,7 @@ def get_advisor_completion(
     )
 
     advisor_reply = _extract_final_reply(run_result)
-    tool_events = _extract_tool_events(run_result.new_items)
+    tool_events = list(_iter_tool_events(run_result.new_items))
 
     response: AdvisorAgentResponse = {
         "advisor_reply": advisor_reply,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Dict
 
 from .course_info_tool import (
@@ -26,20 +27,21 @@ from .search_courses_tool import (
 ToolPayload = Dict[str, Any]
 ToolResult = Dict[str, Any]
 
-ALL_TOOL_DECLARATIONS = (
-    list(RMP_TOOL_DECLARATIONS)
-    + list(COURSE_INFO_TOOL_DECLARATIONS)
-    + list(GENERATE_SCHEDULE_TOOL_DECLARATIONS)
-    + list(GRADUATION_REQUIREMENTS_TOOL_DECLARATIONS)
-    + list(SEARCH_COURSES_TOOL_DECLARATIONS)
+ALL_TOOL_DECLARATIONS: tuple[Dict[str, Any], ...] = (
+    *RMP_TOOL_DECLARATIONS,
+    *COURSE_INFO_TOOL_DECLARATIONS,
+    *GENERATE_SCHEDULE_TOOL_DECLARATIONS,
+    *GRADUATION_REQUIREMENTS_TOOL_DECLARATIONS,
+    *SEARCH_COURSES_TOOL_DECLARATIONS,
 )
-ALL_TOOL_HANDLERS = {
+# Read-only dispatch table so callers can share it without copying
+ALL_TOOL_HANDLERS = MappingProxyType({
     **RMP_TOOL_HANDLERS,
     **COURSE_INFO_TOOL_HANDLERS,
     **GENERATE_SCHEDULE_TOOL_HANDLERS,
     **GRADUATION_REQUIREMENTS_TOOL_HANDLERS,
     **SEARCH_COURSES_TOOL_HANDLERS,
-}
+})
 
 __all__ = ["ALL_TOOL_DECLARATIONS", "ALL_TOOL_HANDLERS", "ToolPayload", "ToolResult"]
 
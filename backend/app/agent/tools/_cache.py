@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteTTLCache:
+    """Small persistent key/value cache with per-entry expiry, backed by SQLite.
+
+    Values are pickled into a single ``answer_cache`` table so cached tool
+    results survive server restarts. The database is opened on first use; if
+    it can't be opened the cache logs a warning and behaves as always empty.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._unavailable = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        # Callers hold self._lock
+        if self._conn is not None or self._unavailable:
+            return self._conn
+
+        conn = None
+        try:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answer_cache ("
+                "key TEXT PRIMARY KEY, value BLOB, expires_at INTEGER, hits INTEGER DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS answer_cache_expires_at ON answer_cache (expires_at)"
+            )
+            # Drop anything that expired while the server was down
+            self._purge_expired(conn)
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache at %s unavailable: %s", self.path, exc)
+            if conn is not None:
+                conn.close()
+            self._unavailable = True
+            return None
+
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _purge_expired(conn: sqlite3.Connection) -> None:
+        # Keys looked up only once are never read again, so expiry on read alone
+        # would let them pile up forever
+        conn.execute("DELETE FROM answer_cache WHERE expires_at <= ?", (int(time.time()),))
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for `key`, or None if missing or expired."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            row = conn.execute(
+                "SELECT value, expires_at FROM answer_cache WHERE key=?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at <= int(time.time()):
+                conn.execute("DELETE FROM answer_cache WHERE key=?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("UPDATE answer_cache SET hits = hits + 1 WHERE key=?", (key,))
+            conn.commit()
+
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            self._purge_expired(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO answer_cache (key, value, expires_at, hits) VALUES (?, ?, ?, 0)",
+                (key, blob, int(time.time()) + ttl),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
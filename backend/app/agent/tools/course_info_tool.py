@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict
 
 from app.services.collegescheduler import get_registration_blocks
@@ -36,6 +37,7 @@ _TOOL_DECLARATIONS = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_course_id(course_id: str) -> str:
     return " ".join(course_id.strip().upper().split())
 
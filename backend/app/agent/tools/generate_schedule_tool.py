@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import uuid
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+from app.services.schedule_store import put_schedule_png
 from app.services.schedule_visualizer import generate_schedule_png
 from .course_info_tool import _handle_get_course_info, _normalize_course_id
 
 ToolPayload = Dict[str, Any]
 ToolResult = Dict[str, Any]
 
+# Upper bound on concurrent course info fetches per schedule
+_MAX_FETCH_WORKERS = 8
+
 _TOOL_DECLARATIONS = [
     {
         "name": "generate_schedule",
@@ -50,81 +54,129 @@ _TOOL_DECLARATIONS = [
 ]
 
 
+def _index_sections(sections: list[Any]) -> Dict[Any, Dict[str, Any]]:
+    """Map section numbers to section dicts, keeping the first of any duplicates."""
+    sections_by_number: Dict[Any, Dict[str, Any]] = {}
+    for section in sections:
+        if isinstance(section, dict):
+            sections_by_number.setdefault(section.get("sectionNumber"), section)
+    return sections_by_number
+
+
+def _parse_course(idx: int, course_obj: Any) -> tuple[tuple[str, str, str] | None, str | None]:
+    """Validate one input course.
+
+    Returns `((course_id, section_id, normalized_course_id), None)` on success
+    or `(None, error_message)` on failure.
+    """
+    if not isinstance(course_obj, dict):
+        return None, f"Course at index {idx} is not an object."
+    
+    course_id = course_obj.get("course_id")
+    section_id = course_obj.get("section_id")
+    
+    if not course_id:
+        return None, f"Course at index {idx} missing 'course_id'."
+    
+    if not section_id:
+        return None, f"Course at index {idx} missing 'section_id'."
+    
+    # Both ids are used as lookup keys below, so they must be hashable scalars
+    if not isinstance(course_id, str):
+        return None, f"Course at index {idx} has a non-string 'course_id'."
+    
+    if not isinstance(section_id, (str, int)):
+        return None, f"Course at index {idx} has an invalid 'section_id'."
+    
+    # Normalize course_id for consistency
+    return (course_id, section_id, _normalize_course_id(course_id)), None
+
+
+def _fetch_course(normalized_course_id: str) -> tuple[ToolResult | None, Dict[Any, Dict[str, Any]], str | None]:
+    """Fetch course info once and index its sections by number.
+
+    Returns `(course_info_result, sections_by_number, None)` on success or
+    `(None, {}, error_message)` if the lookup raised.
+    """
+    # Call the course_info_tool handler to get course data
+    try:
+        course_info_result, _ = _handle_get_course_info({"course_id": normalized_course_id})
+    except Exception as exc:
+        return None, {}, str(exc)
+    
+    data = course_info_result.get("data") or {}
+    registration_blocks = data.get("registration_blocks") or {}
+    return course_info_result, _index_sections(registration_blocks.get("sections", [])), None
+
+
+def _build_course_data(
+    course_id: str,
+    section_id: str,
+    normalized_course_id: str,
+    per_request_cache: Dict[str, tuple[ToolResult | None, Dict[Any, Dict[str, Any]], str | None]],
+) -> tuple[Dict[str, Any] | None, str | None]:
+    """Pick the requested section from fetched course info.
+
+    Returns `(course_data, None)` on success or `(None, error_message)` on failure.
+    """
+    course_info_result, sections_by_number, fetch_error = per_request_cache[normalized_course_id]
+    if fetch_error is not None:
+        return None, f"Failed to fetch info for {course_id}: {fetch_error}"
+    
+    # Check if course was found
+    if not course_info_result.get("found"):
+        return None, f"Course {course_id} not found."
+    
+    # Find the section matching the section_id
+    matching_section = sections_by_number.get(section_id)
+    if not matching_section:
+        return None, f"Section {section_id} not found for course {course_id}."
+    
+    # Add course_code to catalog if not present (for schedule_visualizer).
+    # Copy first: the catalog dict is shared with the course info cache.
+    data = course_info_result.get("data") or {}
+    catalog = dict(data.get("catalog") or {})
+    catalog.setdefault("course_code", normalized_course_id)
+    
+    # Format the course data as expected by schedule_visualizer
+    course_data = {
+        "catalog": catalog,
+        "section": matching_section,
+    }
+    
+    return course_data, None
+
+
 def _handle_generate_schedule(payload: ToolPayload) -> tuple[ToolResult, str | None]:
     """Handle the generate_schedule tool call."""
     courses = payload.get("courses")
-    if not courses:
-        raise ValueError("Function call missing 'courses' array.")
-    
-    if not isinstance(courses, list):
-        raise ValueError("'courses' must be an array.")
+    if not isinstance(courses, list) or not courses:
+        raise ValueError("'courses' must be a non-empty array.")
     
-    if not courses:
-        raise ValueError("'courses' array cannot be empty.")
-    
-    # Collect course data for each course
+    # Validate entries up front so each unique course is fetched only once,
+    # even when lecture and lab sections of the same course are requested
+    parsed_courses = [_parse_course(idx, course_obj) for idx, course_obj in enumerate(courses)]
+    unique_course_ids = list(dict.fromkeys(
+        entry[2] for entry, error in parsed_courses if error is None
+    ))
+
+    # Fetch course info concurrently, keyed by normalized course id
+    per_request_cache: Dict[str, tuple[ToolResult | None, Dict[Any, Dict[str, Any]], str | None]] = {}
+    if unique_course_ids:
+        with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(unique_course_ids))) as executor:
+            per_request_cache = dict(zip(unique_course_ids, executor.map(_fetch_course, unique_course_ids)))
+
+    # Collect course data for each course, in input order
     course_data_list = []
     errors = []
-    
-    for idx, course_obj in enumerate(courses):
-        if not isinstance(course_obj, dict):
-            errors.append(f"Course at index {idx} is not an object.")
-            continue
-        
-        course_id = course_obj.get("course_id")
-        section_id = course_obj.get("section_id")
-        
-        if not course_id:
-            errors.append(f"Course at index {idx} missing 'course_id'.")
-            continue
-        
-        if not section_id:
-            errors.append(f"Course at index {idx} missing 'section_id'.")
-            continue
-        
-        # Normalize course_id for consistency
-        normalized_course_id = _normalize_course_id(course_id)
-        
-        # Call the course_info_tool handler to get course data
-        try:
-            course_info_result, _ = _handle_get_course_info({"course_id": normalized_course_id})
-        except Exception as exc:
-            errors.append(f"Failed to fetch info for {course_id}: {str(exc)}")
-            continue
-        
-        # Check if course was found
-        if not course_info_result.get("found"):
-            errors.append(f"Course {course_id} not found.")
-            continue
-        
-        data = course_info_result.get("data", {})
-        catalog = data.get("catalog", {})
-        registration_blocks = data.get("registration_blocks", {})
-        
-        # Find the section matching the section_id
-        sections = registration_blocks.get("sections", [])
-        matching_section = None
-        
-        for section in sections:
-            if isinstance(section, dict) and section.get("sectionNumber") == section_id:
-                matching_section = section
-                break
-        
-        if not matching_section:
-            errors.append(f"Section {section_id} not found for course {course_id}.")
-            continue
-        
-        # Add course_code to catalog if not present (for schedule_visualizer)
-        if "course_code" not in catalog and normalized_course_id:
-            catalog["course_code"] = normalized_course_id
-        
-        # Format the course data as expected by schedule_visualizer
-        course_data = {
-            "catalog": catalog,
-            "section": matching_section,
-        }
-        
-        course_data_list.append(course_data)
+    for entry, error in parsed_courses:
+        course_data = None
+        if error is None:
+            course_data, error = _build_course_data(*entry, per_request_cache)
+        if error is not None:
+            errors.append(error)
+        else:
+            course_data_list.append(course_data)
     
     # If we have errors and no valid courses, return error
     if errors and not course_data_list:
@@ -142,22 +194,9 @@ def _handle_generate_schedule(payload: ToolPayload) -> tuple[ToolResult, str | N
         # Generate a UUID filename
         filename = f"schedule-{uuid.uuid4()}.png"
         
-        # Determine the path to the public directory
-        # From backend/app/agent/tools/, go up to project root, then to frontend/public/
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent.parent.parent
-        public_dir = project_root / "frontend" / "public"
-        
-        # Ensure the public directory exists
-        public_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Write the PNG file
-        png_path = public_dir / filename
-        with open(png_path, "wb") as f:
-            f.write(png_buffer.getvalue())
-        
-        # Return the URL path (relative to public directory)
-        image_url = f"/{filename}"
+        # Keep the PNG in memory; it's served by the schedule blueprint
+        put_schedule_png(filename, png_buffer.getvalue())
+        image_url = f"/api/schedule/images/{filename}"
         
         result: ToolResult = {
             "success": True,
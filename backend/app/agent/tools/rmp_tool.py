@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict
 
+from cachetools import TTLCache
+
 from app.services.rmp import RMPClient
+from ._cache import SqliteTTLCache
+
+logger = logging.getLogger(__name__)
 
 _DEFAULT_SCHOOL = "University of Nebraska-Lincoln"
 
@@ -24,34 +36,85 @@ _TOOL_DECLARATIONS = [
             "required": ["professor_name"],
         },
     },
+    {
+        "name": "get_professor_summaries",
+        "description": (
+            "Retrieve RateMyProfessors summaries for several instructors at the "
+            "University of Nebraska-Lincoln at once. Prefer this over repeated "
+            "get_professor_summary calls when looking up multiple professors."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "professor_names": {
+                    "type": "array",
+                    "description": "Names of the professors to search for.",
+                    "items": {"type": "string"},
+                },
+            },
+            "required": ["professor_names"],
+        },
+    },
 ]
 
 _rmp_client = RMPClient()
+atexit.register(_rmp_client.close)
+
+# Upper bound on concurrent RMP lookups per batch
+_MAX_FETCH_WORKERS = 8
 
 ToolPayload = Dict[str, Any]
 ToolResult = Dict[str, Any]
 
-# In-memory cache for professor summaries, keyed by normalized professor name
-_PROFESSOR_SUMMARY_CACHE: Dict[str, tuple[ToolResult, str | None]] = {}
+_SUMMARY_CACHE_TTL = 86400
 
+# Bounded in-memory cache for professor summaries, keyed by normalized professor name.
+# Entries expire after a day so shifting RMP scores are eventually picked up.
+_PROFESSOR_SUMMARY_CACHE: TTLCache[str, tuple[ToolResult, str | None]] = TTLCache(maxsize=1024, ttl=_SUMMARY_CACHE_TTL)
+_CACHE_LOCK = threading.Lock()
+stats = {"hits": 0, "misses": 0}
 
+# Persistent second tier so restarts don't have to re-scrape RMP
+_SUMMARY_CACHE_PATH = os.getenv("RMP_CACHE_PATH") or str(
+    Path(__file__).resolve().parents[3] / "rmp_cache.sqlite3"
+)
+_persistent_cache = SqliteTTLCache(_SUMMARY_CACHE_PATH)
+atexit.register(_persistent_cache.close)
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_professor_name(professor_name: str) -> str:
     """Normalize professor name for consistent caching."""
     # Normalize whitespace and strip
     return " ".join(professor_name.strip().split())
 
 
+def _escape_pipes(s: str) -> str:
+    """Escape pipe characters in cell content to avoid breaking table format."""
+    return s.replace("|", "\\|")
+
+
+def _format_cell(value: Any) -> str:
+    # Only strings can contain pipes; numbers and None are rendered as-is
+    if isinstance(value, str):
+        return _escape_pipes(value)
+    return str(value)
+
+
+_MD_HEADERS = ("Name", "Rating", "Difficulty", "Number of Ratings", "Would Take Again")
+_MD_HEADER_ROW = "| " + " | ".join(_MD_HEADERS) + " |"
+_MD_SEPARATOR = "| " + " | ".join(["---"] * len(_MD_HEADERS)) + " |"
+# Heading plus header rows never change, so only the data row is built per call
+_MD_HEAD = f"**Professor Summary:**\n\n{_MD_HEADER_ROW}\n{_MD_SEPARATOR}\n"
+
+
 def _generate_professor_summary_markdown_table(summary: Dict[str, Any]) -> str:
     """Generate a markdown table representation of professor summary data."""
     if not summary:
         return ""
     
-    # Escape pipe characters in cell content to avoid breaking table format
-    def escape_pipes(s: str) -> str:
-        return str(s).replace("|", "\\|")
-    
     # Extract data with defaults
-    name = escape_pipes(summary.get("name", ""))
+    name = summary.get("name", "")
     rating = summary.get("rating", "")
     difficulty = summary.get("difficulty", "")
     num_ratings = summary.get("num_ratings", "")
@@ -61,23 +124,15 @@ def _generate_professor_summary_markdown_table(summary: Dict[str, Any]) -> str:
     if isinstance(would_take_again, (int, float)):
         would_take_again = f"{would_take_again}%"
     
-    # Create markdown table
-    headers = ["Name", "Rating", "Difficulty", "Number of Ratings", "Would Take Again"]
-    header_row = "| " + " | ".join(headers) + " |"
-    separator = "| " + " | ".join(["---"] * len(headers)) + " |"
-    
     data_row = "| " + " | ".join([
-        name,
-        str(rating),
-        str(difficulty),
-        str(num_ratings),
-        str(would_take_again),
+        _format_cell(name),
+        _format_cell(rating),
+        _format_cell(difficulty),
+        _format_cell(num_ratings),
+        _format_cell(would_take_again),
     ]) + " |"
     
-    heading = "**Professor Summary:**"
-    table = "\n".join([header_row, separator, data_row])
-    
-    return f"{heading}\n\n{table}"
+    return _MD_HEAD + data_row
 
 
 def _handle_get_professor_summary(payload: ToolPayload) -> ToolResult:
@@ -88,10 +143,22 @@ def _handle_get_professor_summary(payload: ToolPayload) -> ToolResult:
     normalized_name = _normalize_professor_name(professor_name)
     
     # Check cache first
-    if normalized_name in _PROFESSOR_SUMMARY_CACHE:
-        print("=============== CACHE HIT FOR PROFESSOR SUMMARY ===============")
-        cached_summary, cached_markdown = _PROFESSOR_SUMMARY_CACHE[normalized_name]
-        return cached_summary, cached_markdown
+    with _CACHE_LOCK:
+        cached = _PROFESSOR_SUMMARY_CACHE.get(normalized_name)
+        if cached is not None:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+    if cached is not None:
+        logger.debug("Professor summary cache hit for %s", normalized_name)
+        return cached
+
+    # Not copied back into memory: that would restart the day-long TTL and
+    # let entries outlive their on-disk expiry
+    cached = _persistent_cache.get(normalized_name)
+    if cached is not None:
+        logger.debug("Professor summary persistent cache hit for %s", normalized_name)
+        return cached
 
     summary = _rmp_client.get_professor_summary(
         school_name=_DEFAULT_SCHOOL,
@@ -104,13 +171,60 @@ def _handle_get_professor_summary(payload: ToolPayload) -> ToolResult:
         markdown_table = _generate_professor_summary_markdown_table(summary)
 
     # Store in cache before returning
-    _PROFESSOR_SUMMARY_CACHE[normalized_name] = (summary, markdown_table)
+    with _CACHE_LOCK:
+        _PROFESSOR_SUMMARY_CACHE[normalized_name] = (summary, markdown_table)
+    _persistent_cache.set(normalized_name, (summary, markdown_table), _SUMMARY_CACHE_TTL)
 
     return summary, markdown_table
 
 
+def _fetch_summary(professor_name: str) -> tuple[ToolResult | None, str | None, str | None]:
+    """Look up one professor, returning `(summary, markdown_table, error)`."""
+    try:
+        summary, markdown_table = _handle_get_professor_summary({"professor_name": professor_name})
+    except Exception as exc:
+        return None, None, str(exc)
+    return summary, markdown_table, None
+
+
+def _handle_get_professor_summaries(payload: ToolPayload) -> tuple[ToolResult, str | None]:
+    professor_names = payload.get("professor_names")
+    if not isinstance(professor_names, list) or not professor_names:
+        raise ValueError("Function call missing 'professor_names' array.")
+
+    # Dedupe by normalized name, preserving the requested order
+    unique_names: Dict[str, str] = {}
+    for professor_name in professor_names:
+        if isinstance(professor_name, str) and professor_name.strip():
+            unique_names.setdefault(_normalize_professor_name(professor_name), professor_name)
+    if not unique_names:
+        raise ValueError("'professor_names' must contain at least one name.")
+
+    # Cached names resolve immediately; the rest overlap their RMP round-trips
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(unique_names))) as executor:
+        results = list(executor.map(_fetch_summary, unique_names.values()))
+
+    summaries: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    markdown_tables: list[str] = []
+    for professor_name, (summary, markdown_table, error) in zip(unique_names.values(), results):
+        if error is not None:
+            errors[professor_name] = error
+            continue
+        summaries[professor_name] = summary
+        if markdown_table:
+            markdown_tables.append(markdown_table)
+
+    result: ToolResult = {"summaries": summaries}
+    if errors:
+        result["errors"] = errors
+
+    return result, "\n\n".join(markdown_tables) or None
+
+
 TOOL_DECLARATIONS = _TOOL_DECLARATIONS
 TOOL_HANDLERS = {
     "get_professor_summary": _handle_get_professor_summary,
+    "get_professor_summaries": _handle_get_professor_summaries,
 }
 
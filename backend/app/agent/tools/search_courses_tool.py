@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import threading
 from typing import Any, Dict
 
+from cachetools import TTLCache
+
 from app.services.unl import get_unl_course_info
 
 ToolPayload = Dict[str, Any]
 ToolResult = Dict[str, Any]
 
+# Filtered courses of successful searches keyed by normalized query; repeat
+# department browses are common within an advising session
+_SEARCH_CACHE: TTLCache[str, list[Dict[str, str]]] = TTLCache(maxsize=512, ttl=3600)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Fields kept for each course in search results
+_FIELDS = ("course_code", "course_title", "Description")
+
 _TOOL_DECLARATIONS = [
     {
         "name": "search_courses",
@@ -32,12 +43,15 @@ _TOOL_DECLARATIONS = [
 ]
 
 
-def _filter_course_fields(course: Dict[str, Any]) -> Dict[str, Any]:
-    """Filter a course dict to only include course_code, course_title, and Description."""
+def _normalize_query(query: str) -> str:
+    return " ".join(query.strip().lower().split())
+
+
+def _build_result(filtered_courses: list[Dict[str, str]], query: str) -> ToolResult:
     return {
-        "course_code": course.get("course_code", ""),
-        "course_title": course.get("course_title", ""),
-        "Description": course.get("Description", ""),
+        "found": True,
+        "data": {"courses": filtered_courses},
+        "message": f"Found {len(filtered_courses)} course(s) matching '{query}'.",
     }
 
 
@@ -46,6 +60,21 @@ def _handle_search_courses(payload: ToolPayload) -> tuple[ToolResult, str | None
     if not query:
         raise ValueError("Function call missing 'query'.")
 
+    if not isinstance(query, str):
+        return {
+            "found": False,
+            "data": None,
+            "message": "Search query must be a string.",
+            "errors": {"search": f"Expected a string query, got {type(query).__name__}."},
+        }, None
+
+    cache_key = _normalize_query(query)
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        # Hand out copies so callers can't mutate the cached courses
+        return _build_result([dict(course) for course in cached], query), None
+
     try:
         unl_response = get_unl_course_info(query)
     except Exception as exc:
@@ -80,15 +109,12 @@ def _handle_search_courses(payload: ToolPayload) -> tuple[ToolResult, str | None
         }, None
 
     # Filter each course to only include course_code, course_title, and Description
-    filtered_courses = [_filter_course_fields(course) for course in courses]
+    filtered_courses = [{field: course.get(field, "") for field in _FIELDS} for course in courses]
 
-    result: ToolResult = {
-        "found": True,
-        "data": {"courses": filtered_courses},
-        "message": f"Found {len(filtered_courses)} course(s) matching '{query}'.",
-    }
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[cache_key] = [dict(course) for course in filtered_courses]
 
-    return result, None
+    return _build_result(filtered_courses, query), None
 
 
 TOOL_DECLARATIONS = _TOOL_DECLARATIONS
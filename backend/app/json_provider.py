@@ -0,0 +1,23 @@
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson.
+
+    Tool payloads bubbled up through `/api/agent/chat` are plain dicts, which
+    orjson encodes on its C fast path. Dates are passed through to Flask's
+    default handling so they keep the HTTP date format, as do types orjson
+    doesn't know about (Decimal, `__html__`, ...). Unlike the stdlib encoder,
+    NaN and infinite floats are encoded as `null`.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
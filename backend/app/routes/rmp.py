@@ -3,6 +3,9 @@ from ..services.rmp import RMPClient
 
 rmp_bp = Blueprint("rmp", __name__)
 
+# Shared client so lookups reuse its pooled connections
+_client = RMPClient()
+
 
 @rmp_bp.get("/professor")
 def professor_lookup():
@@ -35,8 +38,7 @@ def professor_lookup():
         return jsonify({"error": "num_reviews must be between 1 and 100"}), 400
 
     try:
-        client = RMPClient()
-        summary = client.get_professor_summary(school, name, comment_limit=num_reviews)
+        summary = _client.get_professor_summary(school, name, comment_limit=num_reviews)
         # Inject audio trigger flag if professor matches Qing Hui
         if summary and isinstance(summary, dict):
             prof_name = str(summary.get("name", "")).strip().lower()
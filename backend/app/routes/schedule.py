@@ -1,5 +1,6 @@
-from flask import Blueprint, request, send_file, jsonify
+from flask import Blueprint, Response, request, send_file, jsonify
 from ..services.schedule_visualizer import generate_schedule_png
+from ..services.schedule_store import get_schedule_png
 
 schedule_bp = Blueprint("schedule", __name__)
 
@@ -44,3 +45,12 @@ def generate_schedule():
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+@schedule_bp.get("/images/<name>")
+def schedule_image(name):
+    """GET /api/schedule/images/<name> -> a schedule PNG generated by the agent."""
+    data = get_schedule_png(name)
+    if data is None:
+        return jsonify({"error": "Schedule image not found"}), 404
+    return Response(data, mimetype="image/png")
@@ -2,6 +2,8 @@ import logging
 from typing import Dict, Any, List, Optional
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,24 @@ class RMPClient:
             "Content-Type": "application/json"
         }
 
+        # Keep-alive session so repeated lookups reuse the TLS connection.
+        # GraphQL queries are read-only, so retrying POSTs is safe.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close pooled connections held by this client."""
+        self._session.close()
+
     def _get_school_id(self, school_name: str) -> Optional[str]:
         """Search for a school's GraphQL ID."""
         query = """
@@ -47,9 +67,8 @@ class RMPClient:
         }
         
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 self.base_url,
-                headers=self.headers,
                 json={"query": query, "variables": variables}
             )
             
@@ -126,9 +145,8 @@ class RMPClient:
                 "numRatings": comment_limit
             }
             
-            resp = requests.post(
+            resp = self._session.post(
                 self.base_url,
-                headers=self.headers,
                 json={"query": query, "variables": variables}
             )
             
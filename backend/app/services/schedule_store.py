@@ -0,0 +1,27 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# Maximum number of generated schedule images kept in memory
+MAX_SCHEDULES = 256
+
+_PNG_STORE: "OrderedDict[str, bytes]" = OrderedDict()
+_PNG_STORE_LOCK = threading.Lock()
+
+
+def put_schedule_png(name: str, data: bytes) -> None:
+    """Store a rendered schedule PNG, evicting the oldest entries past MAX_SCHEDULES."""
+    with _PNG_STORE_LOCK:
+        _PNG_STORE[name] = data
+        _PNG_STORE.move_to_end(name)
+        while len(_PNG_STORE) > MAX_SCHEDULES:
+            _PNG_STORE.popitem(last=False)
+
+
+def get_schedule_png(name: str) -> Optional[bytes]:
+    """Return the stored PNG bytes for `name`, or None if unknown or evicted."""
+    with _PNG_STORE_LOCK:
+        data = _PNG_STORE.get(name)
+        if data is not None:
+            _PNG_STORE.move_to_end(name)
+        return data
@@ -1,7 +1,16 @@
-from bs4 import BeautifulSoup
+import copy
+import os
 import requests
 import re
-from collections import OrderedDict
+import threading
+from pathlib import Path
+from urllib.parse import quote
+from cachetools import TTLCache
+import lxml.html
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 STANDARD_FIELDS = [
     "course_code",
@@ -24,132 +33,229 @@ STANDARD_FIELDS = [
     "Prerequisite for"
 ]
 
+# Compiled once at import; used for every course block on a page
+_CODE_RE = re.compile(r"^([A-Z&]{2,}\s+\d+[A-Z]?)\s{1,}(.*)$")
+# Loose sanity check for catalog queries: course codes ("A&S 100") and plain word/phrase searches
+_QUERY_RE = re.compile(r"^[A-Za-z0-9 &'-]+$")
+_MAX_QUERY_LENGTH = 64
+_NUM_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+# Catalog pages only change between terms, so raw responses are also cached on
+# disk (honoring the server's Cache-Control/ETag) and survive restarts
+_HTTP_CACHE_PATH = os.getenv("UNL_CACHE_PATH") or str(
+    Path(__file__).resolve().parents[2] / "unl_cache.sqlite"
+)
+
+# Shared keep-alive session so catalog lookups reuse pooled connections
+_SESSION = CachedSession(_HTTP_CACHE_PATH, backend="sqlite", expire_after=86400, cache_control=True)
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2)),
+)
+
+# Parsed results keyed by normalized query. The catalog is effectively static
+# within a session; errors get a short TTL so an outage isn't cached for long.
+_RESULT_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_ERROR_CACHE = TTLCache(maxsize=256, ttl=60)
+_CACHE_LOCK = threading.Lock()
+
 def clean_value(v):
     """Clean text value by removing special characters and extra whitespace."""
     return v.replace("\xa0", " ").strip().lstrip(":").strip()
 
+def _is_offered(text):
+    """Whether an <em> string names offered terms (FALL, SPR, SUMMER), case-insensitively."""
+    # Plain substring checks beat a regex search for three short literals
+    if not text:
+        return False
+    upper = text.upper()
+    return "FALL" in upper or "SPR" in upper or "SUMMER" in upper
+
+def _text(element):
+    """Return the element's text pieces, stripped and joined by single spaces."""
+    return " ".join(t for t in (s.strip() for s in element.itertext()) if t)
+
+def _text_after(element):
+    """Join the text following `element` within its parent, like `_text` does."""
+    parts = [element.tail]
+    for sibling in element.itersiblings():
+        # Comments and processing instructions have a non-string tag
+        if isinstance(sibling.tag, str):
+            parts.append(_text(sibling))
+        parts.append(sibling.tail)
+    return " ".join(t for t in (s.strip() for s in parts if s) if t)
+
+def _parse_title_parts(text: str, known_code: str) -> tuple[str, str]:
+    """Given a full title string, extract (course_code, course_title).
+
+    We prefer to use the known_code for robustness, but if the text
+    includes a recognizable prefix, we extract accordingly.
+    """
+    t = clean_value(text)
+    # If the string starts with the known code, strip it off. Only the prefix
+    # is upper-cased rather than the whole title.
+    if t[:len(known_code)].upper() == known_code.upper():
+        remainder = t[len(known_code):].strip(" -:\u00a0")
+        return known_code, clean_value(remainder)
+
+    # Otherwise, try a regex like "SUBJ 123X  Title..."
+    m = _CODE_RE.match(t)
+    if m:
+        parsed_code = clean_value(m.group(1))
+        parsed_title = clean_value(m.group(2))
+        return parsed_code, parsed_title
+
+    # Fallback: return known code and entire string as title
+    return known_code, t
+
+def _split_title(text, search_query):
+    """Split a title like "CSCE 322  Programming Language Concepts" into (course_code, course_title)."""
+    # Reuse the match for both parts rather than re-matching in _parse_title_parts
+    m = _CODE_RE.match(text)
+    if m:
+        return clean_value(m.group(1)), clean_value(m.group(2).strip(" -:\u00a0"))
+    return _parse_title_parts(text, search_query)
+
 def parse_course_block(block, search_query):
     """
     Parse a single course block div into a standardized course info dict.
     
     Args:
-        block: BeautifulSoup element representing a courseblock div
+        block: lxml element representing a courseblock div
         search_query: The original search query (used as fallback for course code)
     
     Returns:
         dict: Course information with standardized fields
     """
-    # Try to determine a human-readable course title separate from the code
-    def parse_title_parts(text: str, known_code: str) -> tuple[str, str]:
-        """Given a full title string, extract (course_code, course_title).
-
-        We prefer to use the known_code for robustness, but if the text
-        includes a recognizable prefix, we extract accordingly.
-        """
-        t = clean_value(text)
-        # If the string starts with the known code, strip it off
-        if t.upper().startswith(known_code.upper()):
-            remainder = t[len(known_code):].strip(" -:\u00a0")
-            return known_code, clean_value(remainder)
-
-        # Otherwise, try a regex like "SUBJ 123X  Title..."
-        m = re.match(r"^([A-Z&]{2,}\s+\d+[A-Z]?)\s{1,}(.*)$", t)
-        if m:
-            parsed_code = clean_value(m.group(1))
-            parsed_title = clean_value(m.group(2))
-            return parsed_code, parsed_title
-
-        # Fallback: return known code and entire string as title
-        return known_code, t
-
-    title_element = block.find("p", class_="courseblocktitle")
-    if title_element:
-        full_title = title_element.get_text(" ", strip=True)
-        # Try to extract course code from the title
-        m = re.match(r"^([A-Z&]{2,}\s+\d+[A-Z]?)\s{1,}(.*)$", full_title)
-        if m:
-            parsed_code, parsed_title = parse_title_parts(full_title, clean_value(m.group(1)))
-        else:
-            parsed_code, parsed_title = parse_title_parts(full_title, search_query)
+    # Collect everything we need from the block in a single tree walk
+    title_element = None
+    desc_elem = None
+    offered_text = None
+    labeled_fields = []
+    for tag in block.iterdescendants("p", "em"):
+        if tag.tag == "p":
+            classes = tag.get("class", "").split()
+            if title_element is None and "courseblocktitle" in classes:
+                title_element = tag
+            if desc_elem is None and "courseblockdesc" in classes:
+                desc_elem = tag
+            strong = tag.find(".//strong")
+            if strong is not None:
+                strong_text = _text(strong)
+                # Usually "<p><strong>Label:</strong> value</p>"; only fall back to
+                # re-rendering the whole paragraph when the label is nested deeper
+                if strong.getparent() is tag:
+                    value = _text_after(strong)
+                else:
+                    value = _text(tag).replace(strong_text, "")
+                labeled_fields.append((strong_text.rstrip(":"), clean_value(value)))
+        elif offered_text is None:
+            # Offered terms live in an <em> like "FALL/SPR", sometimes wrapped in a child tag
+            em_text = _text(tag)
+            if _is_offered(em_text):
+                offered_text = em_text
+
+    if title_element is not None:
+        parsed_code, parsed_title = _split_title(_text(title_element), search_query)
     else:
         # Search results page often has the title in the enclosing article's <h3>
         parsed_code, parsed_title = search_query, ""
-        article = block.find_parent("article")
-        if article:
-            h3 = article.find("h3")
-            if h3:
-                h3_text = h3.get_text(" ", strip=True)
-                m = re.match(r"^([A-Z&]{2,}\s+\d+[A-Z]?)\s{1,}(.*)$", h3_text)
-                if m:
-                    parsed_code, parsed_title = parse_title_parts(h3_text, clean_value(m.group(1)))
-                else:
-                    parsed_code, parsed_title = parse_title_parts(h3_text, search_query)
+        article = next(block.iterancestors("article"), None)
+        if article is not None:
+            h3 = article.find(".//h3")
+            if h3 is not None:
+                parsed_code, parsed_title = _split_title(_text(h3), search_query)
 
     info = {
         "course_code": parsed_code or search_query,
         "course_title": parsed_title or ""
     }
 
-    desc_elem = block.find("p", class_="courseblockdesc")
-    if desc_elem:
-        info["Description"] = clean_value(desc_elem.get_text(" ", strip=True))
-
-    # Parse labeled fields
-    for p in block.find_all("p"):
-        strong = p.find("strong")
-        if strong:
-            label = strong.get_text(" ", strip=True).rstrip(":")
-            value = p.get_text(" ", strip=True).replace(strong.get_text(" ", strip=True), "")
-            info[label] = clean_value(value)
-
-    # Parse Offered field from <em> tags
-    offered_em = block.find("em", string=re.compile("FALL|SPR|SUMMER", re.I))
-    if offered_em:
-        info["Offered"] = offered_em.get_text(strip=True)
-
-    # Convert Offered to list
-    if "Offered" in info and info["Offered"]:
-        info["Offered"] = info["Offered"].replace(" ", "").split("/")
-    else:
-        info["Offered"] = []
+    if desc_elem is not None:
+        info["Description"] = clean_value(_text(desc_elem))
+
+    # Apply labeled fields
+    for label, value in labeled_fields:
+        info[label] = value
+
+    # Offered terms ("FALL/SPR") come from the <em>, else from a labeled field;
+    # split straight into a list, dropping empty terms
+    offered = offered_text if offered_text is not None else info.get("Offered", "")
+    info["Offered"] = [term for term in offered.strip().replace(" ", "").split("/") if term]
 
     # Parse Credit Hours min/max
     if "Credit Hours" in info:
         ch = clean_value(info["Credit Hours"])
         info["Credit Hours"] = ch
-        nums = re.findall(r"[0-9]+(?:\.[0-9]+)?", ch)
-        if len(nums) >= 2:
-            info["min_hours"] = float(nums[0])
-            info["max_hours"] = float(nums[1])
-        elif len(nums) == 1:
-            info["min_hours"] = info["max_hours"] = float(nums[0])
+        # Only the first two numbers matter, so stop scanning after them
+        nums = _NUM_RE.finditer(ch)
+        first = next(nums, None)
+        second = next(nums, None)
+        if second is not None:
+            info["min_hours"] = float(first.group())
+            info["max_hours"] = float(second.group())
+        elif first is not None:
+            info["min_hours"] = info["max_hours"] = float(first.group())
 
-    # Standardize fields in a predictable order (explicitly preserve insertion order)
-    final = OrderedDict()
-    for field in STANDARD_FIELDS:
-        final[field] = info.get(field, "")
+    # Standardize fields in a predictable order (dicts preserve insertion order)
+    return {field: info.get(field, "") for field in STANDARD_FIELDS}
 
-    return final
+def _parse_html(response):
+    """Parse an HTML response body, returning the root element or None if empty."""
+    # Trust an explicit charset header; otherwise let lxml sniff <meta charset>
+    content_type = response.headers.get("content-type", "")
+    encoding = response.encoding if "charset" in content_type.lower() else None
+    try:
+        return lxml.html.fromstring(response.content, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        # Raised when the document had no elements at all
+        return None
 
 def get_unl_course_info(course_code):
     """
     Fetch and parse course information from the UNL course catalog.
     Can search by specific course code (e.g., "CSCE 322") or by words/phrases.
+    Results are cached per query (case-insensitive); callers get their own copy.
         
     Returns:
         dict: Course information with standardized fields (if one course found)
         list: List of course information dicts (if multiple courses found)
         dict: Error dict with "error" key (if no courses found or error occurred)
     """
-    query = course_code.replace(" ", "%20")
+    course_code = course_code.strip()
+    # Reject junk up front instead of spending a catalog round-trip on it
+    if not course_code or len(course_code) > _MAX_QUERY_LENGTH or not _QUERY_RE.match(course_code):
+        return {"error": "Invalid course query"}
+
+    key = course_code.upper()
+    with _CACHE_LOCK:
+        cached = _RESULT_CACHE.get(key)
+        if cached is None:
+            cached = _ERROR_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    result = _fetch_unl_course_info(course_code)
+
+    with _CACHE_LOCK:
+        if isinstance(result, dict) and "error" in result:
+            _ERROR_CACHE[key] = result
+        else:
+            _RESULT_CACHE[key] = result
+    return copy.deepcopy(result)
+
+def _fetch_unl_course_info(course_code):
+    """Fetch and parse a catalog search without caching. See `get_unl_course_info`."""
+    query = quote(course_code, safe="")
     url = f"https://catalog.unl.edu/search/?caturl=%2Fundergraduate&scontext=courses&search={query}"
 
     try:
-        r = requests.get(url, timeout=10)
+        r = _SESSION.get(url, timeout=10)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        root = _parse_html(r)
 
-        blocks = soup.find_all("div", class_="courseblock")
+        blocks = [] if root is None else [el for el in root.find_class("courseblock") if el.tag == "div"]
         if not blocks:
             return {"error": f"No courses found for '{course_code}'"}
 
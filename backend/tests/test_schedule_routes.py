@@ -0,0 +1,27 @@
+import pytest
+from app import create_app
+from app.services.schedule_store import put_schedule_png
+
+
+@pytest.fixture()
+def client():
+    app = create_app()
+    app.config.update({
+        "TESTING": True,
+    })
+    with app.test_client() as client:
+        yield client
+
+
+def test_schedule_image_returns_404_when_missing(client):
+    resp = client.get("/api/schedule/images/schedule-missing.png")
+    assert resp.status_code == 404
+    assert resp.get_json() == {"error": "Schedule image not found"}
+
+
+def test_schedule_image_serves_stored_png(client):
+    put_schedule_png("schedule-test.png", b"\x89PNG fake")
+    resp = client.get("/api/schedule/images/schedule-test.png")
+    assert resp.status_code == 200
+    assert resp.mimetype == "image/png"
+    assert resp.data == b"\x89PNG fake"
@@ -0,0 +1,45 @@
+import sqlite3
+
+from app.agent.tools._cache import SqliteTTLCache
+
+
+def _keys(path):
+    with sqlite3.connect(path) as conn:
+        return sorted(row[0] for row in conn.execute("SELECT key FROM answer_cache"))
+
+
+def test_get_returns_stored_value_until_expiry(tmp_path):
+    cache = SqliteTTLCache(tmp_path / "cache.sqlite3")
+    cache.set("live", {"rating": 4.5}, ttl=60)
+    cache.set("expired", {"rating": 1.0}, ttl=0)
+    assert cache.get("live") == {"rating": 4.5}
+    assert cache.get("expired") is None
+    assert cache.get("missing") is None
+    cache.close()
+
+
+def test_set_purges_expired_rows(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SqliteTTLCache(path)
+    cache.set("stale", "old", ttl=0)
+    cache.set("fresh", "new", ttl=60)
+    cache.close()
+    assert _keys(path) == ["fresh"]
+
+
+def test_values_survive_reopen(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SqliteTTLCache(path)
+    cache.set("prof", ("summary", "| table |"), ttl=60)
+    cache.close()
+
+    reopened = SqliteTTLCache(path)
+    assert reopened.get("prof") == ("summary", "| table |")
+    reopened.close()
+
+
+def test_unopenable_path_behaves_as_empty(tmp_path):
+    cache = SqliteTTLCache(tmp_path / "missing-dir" / "cache.sqlite3")
+    cache.set("prof", "summary", ttl=60)
+    assert cache.get("prof") is None
+    cache.close()
@@ -0,0 +1,37 @@
+import lxml.html
+
+from app.services.unl import parse_course_block
+
+COURSE_BLOCK = """
+<div class="courseblock">
+  <p class="courseblocktitle"><strong>CSCE\xa0322\xa0\xa0Programming Language Concepts</strong></p>
+  <p class="courseblockdesc">List-processing and string-processing languages.</p>
+  <p><strong>Prerequisites:</strong> CSCE 310 or CSCE 311; MATH 208</p>
+  <p><strong>Credit Hours:</strong> 1-6</p>
+  <p><em><i>FALL</i>/<i>SPR</i></em></p>
+</div>
+"""
+
+
+def _parse(html, search_query="CSCE 322"):
+    return parse_course_block(lxml.html.fromstring(html), search_query)
+
+
+def test_parse_course_block_extracts_fields():
+    info = _parse(COURSE_BLOCK)
+    assert info["course_code"] == "CSCE 322"
+    assert info["course_title"] == "Programming Language Concepts"
+    assert info["Description"] == "List-processing and string-processing languages."
+    assert info["Prerequisites"] == "CSCE 310 or CSCE 311; MATH 208"
+    assert info["Offered"] == ["FALL", "SPR"]
+    assert info["Credit Hours"] == "1-6"
+    assert info["min_hours"] == 1.0
+    assert info["max_hours"] == 6.0
+
+
+def test_parse_course_block_falls_back_to_search_query():
+    info = _parse('<div class="courseblock"><p class="courseblocktitle">Seminar</p></div>', "CSCE")
+    assert info["course_code"] == "CSCE"
+    assert info["course_title"] == "Seminar"
+    assert info["Offered"] == []
+    assert info["min_hours"] == ""
@@ -0,0 +1,18 @@
+import pytest
+from app import create_app
+
+
+@pytest.fixture()
+def client():
+    app = create_app()
+    app.config.update({
+        "TESTING": True,
+    })
+    with app.test_client() as client:
+        yield client
+
+
+def test_course_info_rejects_invalid_query(client):
+    resp = client.get("/api/unl/course/CSCE%20322%3Cscript%3E")
+    assert resp.status_code == 200
+    assert resp.get_json() == {"error": "Invalid course query"}